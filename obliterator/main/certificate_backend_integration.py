@@ -4,12 +4,32 @@
 # This is a standalone module that doesn't modify the main GUI
 
 import json
+import base64
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import time
 from typing import Dict, Optional, Tuple
 from datetime import datetime
 import getpass
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Common health check endpoints, tried in order
+HEALTH_ENDPOINTS = ('/health', '/api/health', '/status', '/ping', '/')
+
+# Possible endpoints for PDF generation, tried in order
+PDF_ENDPOINTS = (
+    '/generate-certificate',
+    '/api/generate-certificate',
+    '/certificate/generate',
+    '/api/certificate/generate',
+    '/generate-pdf',
+    '/api/generate-pdf'
+)
 
 class SupabaseAuth:
     """Handle Supabase authentication"""
@@ -20,6 +40,13 @@ class SupabaseAuth:
         self.supabase_key = supabase_key
         self.auth_token = None
         self.user_info = None
+        
+        # Set up session so sign-in/sign-up calls reuse one connection
+        self.session = requests.Session()
+        self.session.headers.update({
+            'apikey': self.supabase_key,
+            'Content-Type': 'application/json'
+        })
     
     def sign_in_with_password(self, email: str, password: str) -> Tuple[bool, Optional[str]]:
         """
@@ -30,22 +57,18 @@ class SupabaseAuth:
         """
         try:
             auth_url = f"{self.supabase_url}/auth/v1/token?grant_type=password"
-            headers = {
-                'apikey': self.supabase_key,
-                'Content-Type': 'application/json'
-            }
             payload = {
                 'email': email,
                 'password': password
             }
             
-            response = requests.post(auth_url, json=payload, headers=headers, timeout=10)
+            response = self.session.post(auth_url, json=payload, timeout=10)
             
             if response.status_code == 200:
                 auth_data = response.json()
                 self.auth_token = auth_data.get('access_token')
                 self.user_info = auth_data.get('user', {})
-                print(f"✅ Successfully authenticated as: {self.user_info.get('email', 'Unknown')}")
+                logger.info("Successfully authenticated as: %s", self.user_info.get('email', 'Unknown'))
                 return True, None
             else:
                 error_msg = response.json().get('error_description', f'Authentication failed: {response.status_code}')
@@ -63,22 +86,18 @@ class SupabaseAuth:
         """
         try:
             signup_url = f"{self.supabase_url}/auth/v1/signup"
-            headers = {
-                'apikey': self.supabase_key,
-                'Content-Type': 'application/json'
-            }
             payload = {
                 'email': email,
                 'password': password
             }
             
-            response = requests.post(signup_url, json=payload, headers=headers, timeout=10)
+            response = self.session.post(signup_url, json=payload, timeout=10)
             
             if response.status_code == 200:
                 auth_data = response.json()
                 self.auth_token = auth_data.get('access_token')
                 self.user_info = auth_data.get('user', {})
-                print(f"✅ Successfully signed up and authenticated as: {self.user_info.get('email', 'Unknown')}")
+                logger.info("Successfully signed up and authenticated as: %s", self.user_info.get('email', 'Unknown'))
                 return True, None
             else:
                 error_msg = response.json().get('error_description', f'Sign up failed: {response.status_code}')
@@ -97,13 +116,47 @@ class SupabaseAuth:
         return {'apikey': self.supabase_key}
     
     def is_authenticated(self) -> bool:
-        """Check if user is authenticated"""
-        return self.auth_token is not None
+        """Check if user is authenticated (expired tokens are rejected locally)"""
+        if self.auth_token is None:
+            return False
+        
+        expires_at = self.get_token_expiry()
+        return expires_at is None or time.time() < expires_at
+    
+    def get_token_expiry(self) -> Optional[float]:
+        """
+        Read the 'exp' claim from the JWT access token without a network call
+        
+        Returns:
+            Expiry as a Unix timestamp, or None if the token carries no readable expiry
+        """
+        try:
+            payload_segment = self.auth_token.split('.')[1]
+            payload_segment += '=' * (-len(payload_segment) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload_segment))
+            return float(claims['exp'])
+        except Exception:
+            return None
+    
+    def __del__(self):
+        """Clean up the session"""
+        if hasattr(self, 'session'):
+            self.session.close()
 
 
 class CertificateBackendClient:
     """Client for interacting with the certificate PDF generation backend"""
     
+    # Seconds a successful health check is trusted, shared by all clients
+    CONNECTION_CHECK_TTL = 60
+    _healthy_backends: Dict[str, float] = {}
+    
+    # PDF endpoint that last worked per backend, tried first next time
+    _pdf_endpoints: Dict[str, str] = {}
+    
+    # Seconds a generated PDF URL is reused for an unchanged certificate file
+    GENERATED_PDF_TTL = 600
+    
     def __init__(self, backend_url: str = "https://obliterator-certificatebackend.onrender.com", auth_token: Optional[str] = None, 
                  supabase_auth: Optional[SupabaseAuth] = None):
         """
@@ -126,37 +179,58 @@ class CertificateBackendClient:
         # Add authentication headers
         if supabase_auth and supabase_auth.is_authenticated():
             self.headers.update(supabase_auth.get_auth_headers())
-            print(f"🔐 Using Supabase authentication for user: {supabase_auth.user_info.get('email', 'Unknown')}")
+            logger.debug("Using Supabase authentication for user: %s", supabase_auth.user_info.get('email', 'Unknown'))
         elif auth_token:
             self.headers['Authorization'] = f'Bearer {auth_token}'
-            print(f"🔐 Using provided auth token")
+            logger.debug("Using provided auth token")
+        
+        # PDF URLs already generated, keyed by (path, mtime, size) of the certificate file
+        self._generated_pdfs: Dict[Tuple[str, int, int], Tuple[float, str]] = {}
         
         # Set up session for connection reuse
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        
+        # One keep-alive connection each for the backend and the PDF storage host; requests run serially
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=1,
+            # Retry failed connects only; a read timeout is not retried so slow replies fail fast
+            max_retries=Retry(total=2, read=0, backoff_factor=0.5)
+        )
+        self.session.mount('https://', adapter)
     
     def test_connection(self) -> bool:
-        """Test connection to the backend server"""
+        """Test connection to the backend server (recent successes are reused)"""
+        checked_at = self._healthy_backends.get(self.backend_url)
+        if checked_at and time.monotonic() - checked_at < self.CONNECTION_CHECK_TTL:
+            return True
+        
+        if self._probe_backend():
+            CertificateBackendClient._healthy_backends[self.backend_url] = time.monotonic()
+            return True
+        return False
+    
+    def _probe_backend(self) -> bool:
+        """Probe the backend health endpoints"""
         try:
-            print(f"Testing connection to: {self.backend_url}")
+            logger.debug("Testing connection to: %s", self.backend_url)
             
             # Try multiple common health check endpoints
-            health_endpoints = ['/health', '/api/health', '/status', '/ping', '/']
-            
-            for endpoint in health_endpoints:
+            for endpoint in HEALTH_ENDPOINTS:
                 try:
                     url = f"{self.backend_url}{endpoint}"
-                    print(f"Trying: {url}")
+                    logger.debug("Trying: %s", url)
                     response = self.session.get(url, timeout=10)
-                    print(f"Response status: {response.status_code}")
+                    logger.debug("Response status: %s", response.status_code)
                     
                     if response.status_code in [200, 404]:  # 404 might mean endpoint exists but wrong path
                         if response.status_code == 200:
-                            print(f"✅ Health check successful at {endpoint}")
+                            logger.debug("Health check successful at %s", endpoint)
                         return True
                         
                 except requests.exceptions.RequestException as e:
-                    print(f"Failed {endpoint}: {e}")
+                    logger.debug("Failed %s: %s", endpoint, e)
                     continue
             
             # If no health endpoint works, try a simple GET to root
@@ -164,7 +238,7 @@ class CertificateBackendClient:
             return response.status_code < 500  # Any response except server error
             
         except Exception as e:
-            print(f"Backend connection test failed: {e}")
+            logger.warning("Backend connection test failed: %s", e)
             return False
     
     # Enhanced convert_obliterator_to_sanitization_format method
@@ -183,7 +257,7 @@ class CertificateBackendClient:
                 return obliterator_json
                 
         except Exception as e:
-            print(f"❌ Error processing JSON: {e}")
+            logger.error("Error processing JSON: %s", e)
             raise
     
     def generate_pdf_from_json(self, json_file_path: str) -> Tuple[bool, Optional[str], Optional[str]]:
@@ -197,89 +271,107 @@ class CertificateBackendClient:
             Tuple of (success, pdf_url, error_message)
         """
         try:
-            print(f"📄 Reading JSON file: {json_file_path}")
+            logger.debug("Reading JSON file: %s", json_file_path)
             
             # Check if file exists
             if not os.path.exists(json_file_path):
                 error_msg = f"JSON file not found: {json_file_path}"
-                print(f"❌ {error_msg}")
+                logger.error(error_msg)
                 return False, None, error_msg
             
+            # Retries and double-clicks on an unchanged file reuse the earlier result
+            file_stat = os.stat(json_file_path)
+            cache_key = (os.path.abspath(json_file_path), file_stat.st_mtime_ns, file_stat.st_size)
+            cached = self._generated_pdfs.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.GENERATED_PDF_TTL:
+                logger.debug("Reusing PDF generated for %s", json_file_path)
+                return True, cached[1], None
+            
             # Read the JSON file
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                obliterator_json = json.load(f)
+            with open(json_file_path, 'rb') as f:
+                raw_json = f.read()
+            obliterator_json = json.loads(raw_json)
             
-            print(f"✅ JSON loaded successfully")
+            logger.debug("JSON loaded successfully")
             
             # Convert to backend format
             sanitization_data = self.convert_obliterator_to_sanitization_format(obliterator_json)
             
-            # Try multiple possible endpoints for PDF generation
-            endpoints = [
-                '/generate-certificate',
-                '/api/generate-certificate', 
-                '/certificate/generate',
-                '/api/certificate/generate',
-                '/generate-pdf',
-                '/api/generate-pdf'
-            ]
+            # Flat certificates are sent exactly as read; only wrapped ones are re-serialized.
+            # Either way the body is built once and reused for every endpoint attempt
+            if sanitization_data is obliterator_json:
+                request_body = raw_json
+            else:
+                request_body = json.dumps(sanitization_data, separators=(',', ':'), allow_nan=False).encode('utf-8')
+            
+            # Same certificate, same key: lets the backend deduplicate retried requests
+            idempotency_key = hashlib.sha256(request_body).hexdigest()
+            
+            # Try multiple possible endpoints for PDF generation, last known good first
+            known_endpoint = self._pdf_endpoints.get(self.backend_url)
+            if known_endpoint:
+                endpoints = (known_endpoint,) + tuple(e for e in PDF_ENDPOINTS if e != known_endpoint)
+            else:
+                endpoints = PDF_ENDPOINTS
             
             for endpoint in endpoints:
                 try:
                     url = f"{self.backend_url}{endpoint}"
-                    print(f"🚀 Trying PDF generation at: {url}")
+                    logger.debug("Trying PDF generation at: %s", url)
                     
                     # Send to backend
                     response = self.session.post(
                         url,
-                        json=sanitization_data,
+                        data=request_body,
+                        headers={'Idempotency-Key': idempotency_key},
                         timeout=60  # Increased timeout for PDF generation
                     )
                     
-                    print(f"📡 Response status: {response.status_code}")
-                    print(f"📡 Response headers: {dict(response.headers)}")
+                    logger.debug("Response status: %s", response.status_code)
+                    logger.debug("Response headers: %s", response.headers)
                     
                     if response.status_code == 200:
+                        CertificateBackendClient._pdf_endpoints[self.backend_url] = endpoint
                         try:
                             result = response.json()
                             pdf_url = result.get('pdf_url') or result.get('url') or result.get('download_url')
                             
                             if pdf_url:
-                                print(f"✅ PDF generated successfully: {pdf_url}")
+                                logger.info("PDF generated successfully: %s", pdf_url)
+                                self._generated_pdfs[cache_key] = (time.monotonic(), pdf_url)
                                 return True, pdf_url, None
                             else:
-                                print(f"⚠️  Success response but no PDF URL in: {result}")
+                                logger.warning("Success response but no PDF URL in: %s", result)
                                 # Maybe the PDF is returned directly as binary content
                                 if response.headers.get('content-type', '').startswith('application/pdf'):
-                                    print("📄 PDF returned as binary content")
+                                    logger.info("PDF returned as binary content")
                                     return True, None, None  # Success but no URL
                                 
                         except json.JSONDecodeError:
-                            print("⚠️  Response is not JSON, checking if it's PDF binary...")
+                            logger.debug("Response is not JSON, checking if it's PDF binary...")
                             if response.headers.get('content-type', '').startswith('application/pdf'):
-                                print("📄 PDF returned as binary content")
+                                logger.info("PDF returned as binary content")
                                 return True, None, None
                             
                     elif response.status_code == 404:
-                        print(f"⚠️  Endpoint not found: {endpoint}")
+                        logger.debug("Endpoint not found: %s", endpoint)
                         continue  # Try next endpoint
                     else:
-                        error_msg = f"Backend returned {response.status_code}: {response.text[:500]}"
-                        print(f"❌ {error_msg}")
+                        logger.warning("Backend returned %s: %s", response.status_code, response.text[:500])
                         # Don't return error yet, try other endpoints
                         
                 except requests.exceptions.RequestException as e:
-                    print(f"❌ Request failed for {endpoint}: {e}")
+                    logger.warning("Request failed for %s: %s", endpoint, e)
                     continue
             
             # If we get here, all endpoints failed
             error_msg = "All PDF generation endpoints failed"
-            print(f"❌ {error_msg}")
+            logger.error(error_msg)
             return False, None, error_msg
                 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
-            print(f"❌ Error generating PDF: {error_msg}")
+            logger.error("Error generating PDF: %s", error_msg)
             return False, None, error_msg
     
     def download_pdf(self, pdf_url: str, output_path: str) -> bool:
@@ -294,27 +386,60 @@ class CertificateBackendClient:
             True if successful, False otherwise
         """
         try:
-            print(f"⬇️  Downloading PDF from: {pdf_url}")
+            logger.debug("Downloading PDF from: %s", pdf_url)
             
             # Make sure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
             
-            response = self.session.get(pdf_url, timeout=60, stream=True)
-            if response.status_code == 200:
-                with open(output_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        
-                print(f"✅ PDF downloaded to: {output_path}")
-                return True
-            else:
-                print(f"❌ Failed to download PDF: {response.status_code} - {response.text[:200]}")
-                return False
+            with self.session.get(pdf_url, timeout=60, stream=True) as response:
+                if response.status_code == 200:
+                    # Stream straight to disk; the .part file is only renamed once complete
+                    part_path = f"{output_path}.part"
+                    try:
+                        with open(part_path, 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=65536):
+                                f.write(chunk)
+                        os.replace(part_path, output_path)
+                    except Exception:
+                        # Never leave a truncated download behind
+                        if os.path.exists(part_path):
+                            os.remove(part_path)
+                        raise
+                            
+                    logger.info("PDF downloaded to: %s", output_path)
+                    return True
+                else:
+                    logger.error("Failed to download PDF: %s - %s", response.status_code, response.text[:200])
+                    return False
                 
         except Exception as e:
-            print(f"❌ Error downloading PDF: {e}")
+            logger.error("Error downloading PDF: %s", e)
             return False
     
+    def _process_certificate(self, cert_dir: str, json_file: str, output_dir: Optional[str]) -> Dict:
+        """Generate (and optionally download) the PDF for one certificate file"""
+        json_path = os.path.join(cert_dir, json_file)
+        logger.debug("Processing: %s", json_file)
+        
+        success, pdf_url, error = self.generate_pdf_from_json(json_path)
+        
+        cert_result = {
+            'json_file': json_file,
+            'json_path': json_path,
+            'success': success,
+            'pdf_url': pdf_url,
+            'error': error
+        }
+        
+        if success and pdf_url and output_dir:
+            # Download the PDF locally
+            pdf_filename = json_file.replace('.json', '.pdf')
+            pdf_path = os.path.join(output_dir, pdf_filename)
+            if self.download_pdf(pdf_url, pdf_path):
+                cert_result['local_pdf_path'] = pdf_path
+        
+        return cert_result
+    
     def batch_process_certificates(self, cert_dir: str, output_dir: str = None) -> Dict:
         """
         Process all JSON certificates in a directory
@@ -344,46 +469,27 @@ class CertificateBackendClient:
                      if f.endswith('.json') and os.path.isfile(os.path.join(cert_dir, f))]
         
         if not json_files:
-            print(f"⚠️  No JSON files found in {cert_dir}")
+            logger.warning("No JSON files found in %s", cert_dir)
             return results
         
-        print(f"📁 Found {len(json_files)} JSON files to process")
+        logger.info("Found %d JSON files to process", len(json_files))
         
-        for json_file in json_files:
-            json_path = os.path.join(cert_dir, json_file)
-            print(f"\n{'='*60}")
-            print(f"📄 Processing: {json_file}")
-            print(f"{'='*60}")
-            
-            success, pdf_url, error = self.generate_pdf_from_json(json_path)
-            
-            cert_result = {
-                'json_file': json_file,
-                'json_path': json_path,
-                'success': success,
-                'pdf_url': pdf_url,
-                'error': error
-            }
-            
-            if success and pdf_url and output_dir:
-                # Download the PDF locally
-                pdf_filename = json_file.replace('.json', '.pdf')
-                pdf_path = os.path.join(output_dir, pdf_filename)
-                if self.download_pdf(pdf_url, pdf_path):
-                    cert_result['local_pdf_path'] = pdf_path
-            
+        # One certificate at a time against the hosted backend
+        for index, json_file in enumerate(json_files, 1):
+            cert_result = self._process_certificate(cert_dir, json_file, output_dir)
             results['certificates'].append(cert_result)
             results['processed'] += 1
             
-            if success:
+            if cert_result['success']:
                 results['successful'] += 1
-                print(f"✅ Success: {json_file}")
+                logger.info("Success: %s", cert_result['json_file'])
             else:
                 results['failed'] += 1
-                print(f"❌ Failed: {json_file} - {error}")
+                logger.warning("Failed: %s - %s", cert_result['json_file'], cert_result['error'])
             
-            # Small delay to avoid overwhelming the server
-            time.sleep(1)
+            # Small delay to avoid overwhelming the server (nothing left to pace after the last file)
+            if index < len(json_files):
+                time.sleep(1)
         
         return results
     
@@ -460,6 +566,11 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     # Initialize authentication if not disabled
     supabase_auth = None
     if not args.no_auth:
@@ -29,22 +29,40 @@ class CertificateViewerFrame(customtkinter.CTkFrame):
         self.cert_dir = cert_dir
         self.backend_client = None
         
+        self.setup_ui()
+        self.refresh_certificate_list()
+        
         # Initialize backend client if available
         if HAS_BACKEND_INTEGRATION:
-            self.backend_client = CertificateBackendClient()
             self.test_backend_connection()
-        
-        self.setup_ui()
-        self.refresh_certificate_list()
     
     def test_backend_connection(self):
-        """Test connection to backend server"""
-        if self.backend_client:
-            if self.backend_client.test_connection():
-                print("Backend server connected")
-            else:
-                print("Backend server not available - PDF generation disabled")
-                self.backend_client = None
+        """Test connection to backend server in the background"""
+        client = CertificateBackendClient()
+        
+        def check():
+            connected = client.test_connection()
+            self.after(0, lambda: self._on_backend_checked(client, connected))
+        
+        # Run in thread so the viewer is usable while the backend is probed
+        threading.Thread(target=check, daemon=True).start()
+    
+    def _on_backend_checked(self, client, connected):
+        """Enable PDF actions once the backend answered"""
+        if connected:
+            print("Backend server connected")
+            self.backend_client = client
+            self.generate_pdf_btn.configure(
+                text="Generate PDF",
+                state="normal" if self.selected_cert_file else "disabled"
+            )
+            self.batch_pdf_btn.configure(state="normal")
+        else:
+            print("Backend server not available - PDF generation disabled")
+            self.generate_pdf_btn.configure(
+                state="disabled",
+                text="PDF (Backend Offline)"
+            )
     
     def setup_ui(self):
         """Setup the certificate viewer UI"""
@@ -149,11 +167,17 @@ class CertificateViewerFrame(customtkinter.CTkFrame):
         )
         self.generate_pdf_btn.pack(side="left", padx=5)
         
-        if not HAS_BACKEND_INTEGRATION or not self.backend_client:
+        if not HAS_BACKEND_INTEGRATION:
             self.generate_pdf_btn.configure(
                 state="disabled",
                 text="PDF (Backend Offline)"
             )
+        elif not self.backend_client:
+            # test_backend_connection() reports the real state once the probe finishes
+            self.generate_pdf_btn.configure(
+                state="disabled",
+                text="Checking backend..."
+            )
         
         # Batch PDF generation
         self.batch_pdf_btn = customtkinter.CTkButton(
@@ -13,6 +13,7 @@ import threading
 import time
 import sys
 from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Pillow library for image support ---
 from PIL import Image, ImageTk
@@ -769,14 +770,10 @@ class CompletionFrame(customtkinter.CTkFrame):
                 print("="*60 + "\n")
                 return
             
-            # Load and decode session
+            # Load session (stored as plain JSON by the login system)
             try:
-                import base64
-                with open(session_file, 'r') as f:
-                    encrypted_data = f.read()
-                
-                decrypted_data = base64.b64decode(encrypted_data.encode()).decode()
-                session_data = json.loads(decrypted_data)
+                with open(session_file, 'rb') as f:
+                    session_data = json.loads(f.read())
                 
                 user_info = session_data.get('user', {})
                 email = user_info.get('email')
@@ -886,6 +883,10 @@ class CompletionFrame(customtkinter.CTkFrame):
         # Ensure certificate directory exists
         os.makedirs(CERT_DIR, exist_ok=True)
         
+        # A single worker keeps backend load serial and the client session on one thread
+        pdf_executor = ThreadPoolExecutor(max_workers=1)
+        pdf_jobs = []
+        
         for i, device in enumerate(self.wiped_devices, 1):
             device_path = f"/dev/{device['name']}"
             serial_number = device['serial_number']
@@ -957,13 +958,14 @@ class CompletionFrame(customtkinter.CTkFrame):
                     # Wait a moment for file system to sync
                     time.sleep(0.5)
                     
-                    # Find .json files modified in last 10 seconds
+                    # Find .json files modified in last 10 seconds (one cutoff for the whole scan)
                     recent_files = []
+                    recent_cutoff = time.time() - 10
                     try:
                         for filename in os.listdir(CERT_DIR):
                             if filename.endswith('.json'):
                                 filepath = os.path.join(CERT_DIR, filename)
-                                if os.path.getmtime(filepath) > (time.time() - 10):
+                                if os.path.getmtime(filepath) > recent_cutoff:
                                     # Check if this file contains our serial number
                                     try:
                                         with open(filepath, 'r') as f:
@@ -999,31 +1001,10 @@ class CompletionFrame(customtkinter.CTkFrame):
                         self.after(0, lambda d=device['name'], p=json_filepath: self.update_cert_status(
                             f"✅ JSON certificate generated for /dev/{d}\n   File: {p}"))
                         
-                        # Try PDF generation if backend available
+                        # PDF round-trips run in the background; the next device's JSON need not wait
                         if self.backend_client:
-                            self.after(0, lambda d=device['name']: self.update_cert_status(
-                                f"📤 Sending /dev/{d} certificate to backend..."))
-                            
-                            success_pdf, pdf_url, error = self.backend_client.generate_pdf_from_json(json_filepath)
-                            
-                            if success_pdf and pdf_url:
-                                pdf_success_count += 1
-                                pdf_filename = os.path.basename(json_filepath).replace('.json', '.pdf')
-                                pdf_path = os.path.join(CERT_DIR, pdf_filename)
-                                
-                                if self.backend_client.download_pdf(pdf_url, pdf_path):
-                                    self.after(0, lambda d=device['name']: self.update_cert_status(
-                                        f"✅ PDF downloaded for /dev/{d}"))
-                                else:
-                                    self.after(0, lambda d=device['name']: self.update_cert_status(
-                                        f"⚠️ PDF generated but download failed for /dev/{d}"))
-                            elif success_pdf:
-                                pdf_success_count += 1
-                                self.after(0, lambda d=device['name']: self.update_cert_status(
-                                    f"✅ PDF generated for /dev/{d}"))
-                            else:
-                                self.after(0, lambda d=device['name'], e=error: self.update_cert_status(
-                                    f"⚠️ PDF generation failed for /dev/{d}: {str(e)[:100]}"))
+                            pdf_jobs.append(pdf_executor.submit(
+                                self._deliver_certificate_pdf, device['name'], json_filepath))
                                 
                     except json.JSONDecodeError as e:
                         self.after(0, lambda d=device['name'], e=str(e): self.update_cert_status(
@@ -1042,6 +1023,10 @@ class CompletionFrame(customtkinter.CTkFrame):
                 self.after(0, lambda tb=traceback.format_exc(): self.update_cert_status(
                     f"DEBUG: Traceback:\n{tb}"))
         
+        # Wait for deferred PDF work before reporting totals
+        pdf_executor.shutdown(wait=True)
+        pdf_success_count = sum(1 for job in pdf_jobs if job.result())
+        
         # Final status
         self.after(0, lambda: self.certificate_generation_complete(
             success_count, pdf_success_count, total_devices))
@@ -1050,6 +1035,36 @@ class CompletionFrame(customtkinter.CTkFrame):
         if HAS_CERT_VIEWER and hasattr(self, 'cert_viewer'):
             self.after(0, lambda: self.cert_viewer.refresh_certificate_list())
     
+    def _deliver_certificate_pdf(self, device_name, json_filepath):
+        """Send one JSON certificate to the backend and fetch its PDF; returns True if the PDF was generated"""
+        try:
+            self.after(0, lambda d=device_name: self.update_cert_status(
+                f"📤 Sending /dev/{d} certificate to backend..."))
+            
+            success_pdf, pdf_url, error = self.backend_client.generate_pdf_from_json(json_filepath)
+            
+            if success_pdf and pdf_url:
+                pdf_filename = os.path.basename(json_filepath).replace('.json', '.pdf')
+                pdf_path = os.path.join(CERT_DIR, pdf_filename)
+                
+                if self.backend_client.download_pdf(pdf_url, pdf_path):
+                    self.after(0, lambda d=device_name: self.update_cert_status(
+                        f"✅ PDF downloaded for /dev/{d}"))
+                else:
+                    self.after(0, lambda d=device_name: self.update_cert_status(
+                        f"⚠️ PDF generated but download failed for /dev/{d}"))
+            elif success_pdf:
+                self.after(0, lambda d=device_name: self.update_cert_status(
+                    f"✅ PDF generated for /dev/{d}"))
+            else:
+                self.after(0, lambda d=device_name, e=error: self.update_cert_status(
+                    f"⚠️ PDF generation failed for /dev/{d}: {str(e)[:100]}"))
+            return success_pdf
+        except Exception as e:
+            self.after(0, lambda d=device_name, e=str(e): self.update_cert_status(
+                f"⚠️ PDF generation failed for /dev/{d}: {e[:100]}"))
+            return False
+    
     def certificate_generation_complete(self, json_count, pdf_count, total_devices):
         """Handle completion of certificate generation"""
         self.generate_certs_button.configure(state="normal", text="Generate Certificates")
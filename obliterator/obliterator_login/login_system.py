@@ -10,15 +10,26 @@ import tkinter as tk
 from tkinter import messagebox
 import threading
 import time
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
+import re
 import json
-import base64
+import hashlib
 import sys
+from functools import cached_property, lru_cache
 from datetime import datetime, timedelta
 import requests
-from typing import Optional, Dict, Any, Callable
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Callable, Tuple
 import logging
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 # Configure logging
 os.makedirs('logs', exist_ok=True)
 logging.basicConfig(
@@ -51,6 +62,68 @@ COLORS = {
     "border": "#475569"             # Border color
 }
 
+# Reliable endpoints probed in parallel by the connectivity check (all accept HEAD)
+CONNECTIVITY_ENDPOINTS = (
+    "https://www.google.com",
+    "https://www.cloudflare.com/cdn-cgi/trace",
+    "https://www.cloudflare.com"
+)
+
+# Minimal shape check run before any network request is made
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# Seconds a connectivity check result is reused before probing again
+NETWORK_CHECK_TTL = 10
+
+@lru_cache(maxsize=16)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Shared CTkFont per (size, weight) so identical specs create one Tk font"""
+    return ctk.CTkFont(size=size, weight=weight)
+
+# Pre-scaled logos are kept here so later launches skip the resize
+LOGO_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "obliterator")
+
+def _get_scaled_logo(path: str, max_size: int):
+    """Return (image, width, height) for a logo scaled to fit max_size, cached on disk"""
+    # One cache file per (logo, size); it carries the source's mtime, so a changed logo overwrites it
+    src_mtime_ns = os.stat(path).st_mtime_ns
+    key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+    cache_path = os.path.join(LOGO_CACHE_DIR, f"logo_{max_size}_{key}.png")
+    
+    if os.path.exists(cache_path) and os.stat(cache_path).st_mtime_ns == src_mtime_ns:
+        try:
+            cached_image = Image.open(cache_path)
+            cached_image.load()
+            return cached_image, cached_image.size[0], cached_image.size[1]
+        except Exception as e:
+            # Unreadable cache entry: drop it and rebuild from the source logo
+            logger.warning(f"Discarding unreadable cached logo: {e}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+    
+    pil_image = Image.open(path)
+    if pil_image.width <= max_size and pil_image.height <= max_size:
+        return pil_image, pil_image.width, pil_image.height
+    
+    # LANCZOS only pays off for the large splash logo
+    resample = Image.Resampling.LANCZOS if max_size > 250 else Image.Resampling.BILINEAR
+    pil_image.thumbnail((max_size, max_size), resample)
+    new_width, new_height = pil_image.size
+    
+    try:
+        os.makedirs(LOGO_CACHE_DIR, exist_ok=True)
+        # Save under a temp name and swap it in so an interrupted save never leaves a truncated PNG
+        tmp_path = f"{cache_path}.tmp"
+        pil_image.save(tmp_path, format="PNG", optimize=True)
+        os.utime(tmp_path, ns=(src_mtime_ns, src_mtime_ns))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache scaled logo: {e}")
+    
+    return pil_image, new_width, new_height
+
 class ConfigManager:
     """Handles configuration loading"""
     
@@ -63,6 +136,7 @@ class ConfigManager:
         # Try environment variables first
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_ANON_KEY")
+        self._config_raw = {}
         
         # Try config file if env vars not found
         if not self.supabase_url or not self.supabase_key:
@@ -71,15 +145,28 @@ class ConfigManager:
                     config = json.load(f)
                     self.supabase_url = self.supabase_url or config.get("supabase_url")
                     self.supabase_key = self.supabase_key or config.get("supabase_key")
-                    self.app_config = config.get("app_config", {})
-                    self.security = config.get("security", {})
-                    self.ui = config.get("ui", {})
+                    self._config_raw = config
             except FileNotFoundError:
                 logger.error("No config.json found and no environment variables set")
                 raise ValueError("Configuration not found")
         
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("Supabase URL and key must be provided")
+    
+    @cached_property
+    def app_config(self) -> Dict[str, Any]:
+        """Application settings section"""
+        return self._config_raw.get("app_config", {})
+    
+    @cached_property
+    def security(self) -> Dict[str, Any]:
+        """Security settings section"""
+        return self._config_raw.get("security", {})
+    
+    @cached_property
+    def ui(self) -> Dict[str, Any]:
+        """UI settings section"""
+        return self._config_raw.get("ui", {})
 
 class SessionManager:
     """Handles user session management"""
@@ -87,24 +174,30 @@ class SessionManager:
     def __init__(self):
         self.session_file = ".session_data"
         self.session_data = {}
+        self._expires_ts = None
         self.load_session()
     
     def save_session(self, user_data: Dict[str, Any], remember_me: bool = False):
         """Save user session"""
+        now = datetime.now()
+        expires = now + timedelta(hours=24)
         session_info = {
             "user": user_data,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "remember_me": remember_me,
-            "expires": (datetime.now() + timedelta(hours=24)).isoformat()
+            "expires": expires.isoformat()
         }
         
-        # Simple encoding (in production, use proper encryption)
-        encrypted_data = base64.b64encode(json.dumps(session_info).encode()).decode()
+        payload = json.dumps(session_info, separators=(',', ':')).encode()
         
         try:
-            with open(self.session_file, 'w') as f:
-                f.write(encrypted_data)
+            # Write to a temp file and swap it in so a partial write never corrupts the session
+            tmp_file = f"{self.session_file}.tmp"
+            with open(tmp_file, 'wb', buffering=65536) as f:
+                f.write(payload)
+            os.replace(tmp_file, self.session_file)
             self.session_data = session_info
+            self._expires_ts = expires.timestamp()
             logger.info("Session saved successfully")
         except Exception as e:
             logger.error(f"Failed to save session: {e}")
@@ -113,15 +206,15 @@ class SessionManager:
         """Load session data"""
         try:
             if os.path.exists(self.session_file):
-                with open(self.session_file, 'r') as f:
-                    encrypted_data = f.read()
+                with open(self.session_file, 'rb', buffering=65536) as f:
+                    raw = f.read()
                 
-                decrypted_data = base64.b64decode(encrypted_data.encode()).decode()
-                self.session_data = json.loads(decrypted_data)
+                # json.loads accepts bytes directly, no decode pass needed
+                self.session_data = json.loads(raw)
                 
-                # Check expiration
-                expires = datetime.fromisoformat(self.session_data.get("expires", "1970-01-01"))
-                if datetime.now() > expires:
+                # Check expiration (parsed once, then compared as a float)
+                self._expires_ts = datetime.fromisoformat(self.session_data.get("expires", "1970-01-01")).timestamp()
+                if time.time() > self._expires_ts:
                     self.clear_session()
                     return None
                 
@@ -138,59 +231,100 @@ class SessionManager:
             if os.path.exists(self.session_file):
                 os.remove(self.session_file)
             self.session_data = {}
+            self._expires_ts = None
             logger.info("Session cleared")
         except Exception as e:
             logger.error(f"Failed to clear session: {e}")
     
     def is_valid_session(self) -> bool:
         """Check if session is valid"""
-        if not self.session_data:
-            return False
-        
-        try:
-            expires = datetime.fromisoformat(self.session_data.get("expires", "1970-01-01"))
-            return datetime.now() < expires
-        except:
-            return False
+        return self._expires_ts is not None and time.time() < self._expires_ts
 
 class NetworkChecker:
     """Handles network connectivity checks"""
     
-    @staticmethod
-    def check_internet_connection() -> bool:
+    _last_check: Optional[Tuple[float, bool]] = None
+    _supabase_checks: Dict[str, Tuple[float, bool]] = {}
+    # Headerless session for third-party probes; Supabase credentials must never reach them
+    _probe_session: Optional[requests.Session] = None
+    
+    @classmethod
+    def _get_probe_session(cls) -> requests.Session:
+        """Return the shared, credential-free session used for internet probes"""
+        if cls._probe_session is None:
+            cls._probe_session = requests.Session()
+            cls._probe_session.mount('https://', HTTPAdapter(
+                pool_maxsize=len(CONNECTIVITY_ENDPOINTS),
+                max_retries=Retry(total=2, read=0, backoff_factor=0.2)
+            ))
+            atexit.register(cls._probe_session.close)
+        return cls._probe_session
+    
+    @classmethod
+    def invalidate(cls):
+        """Forget cached results so the next check probes the network"""
+        cls._last_check = None
+        cls._supabase_checks.clear()
+    
+    @classmethod
+    def check_internet_connection(cls) -> bool:
         """Check if internet connection is available"""
+        now = time.monotonic()
+        if cls._last_check and now - cls._last_check[0] < NETWORK_CHECK_TTL:
+            return cls._last_check[1]
+        
+        result = cls._probe_internet()
+        # Only successes are cached, so a machine that comes back online is noticed at once
+        cls._last_check = (now, result) if result else None
+        return result
+    
+    @classmethod
+    def _probe_internet(cls) -> bool:
+        """Probe the connectivity endpoints"""
+        http = cls._get_probe_session()
+        # Probe all endpoints at once and succeed on the first good answer
+        executor = ThreadPoolExecutor(max_workers=len(CONNECTIVITY_ENDPOINTS))
         try:
-            # Try multiple reliable endpoints
-            endpoints = [
-                "https://www.google.com",
-                "https://httpbin.org/get",
-                "https://www.cloudflare.com"
+            futures = [
+                executor.submit(http.head, endpoint, timeout=3, allow_redirects=False)
+                for endpoint in CONNECTIVITY_ENDPOINTS
             ]
-            
-            for endpoint in endpoints:
+            for future in as_completed(futures, timeout=5):
                 try:
-                    response = requests.get(endpoint, timeout=5)
-                    if response.status_code == 200:
+                    if 200 <= future.result().status_code < 400:
                         return True
-                except:
+                except Exception:
                     continue
             
             return False
         except Exception:
             return False
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     
-    @staticmethod
-    def check_supabase_connection(url: str, headers: dict) -> bool:
+    @classmethod
+    def check_supabase_connection(cls, url: str, headers: Optional[dict] = None, session: Optional[requests.Session] = None) -> bool:
         """Check Supabase specific connection"""
+        now = time.monotonic()
+        cached = cls._supabase_checks.get(url)
+        if cached and now - cached[0] < NETWORK_CHECK_TTL:
+            return cached[1]
+        
+        result = cls._probe_supabase(url, headers, session)
+        if result:
+            cls._supabase_checks[url] = (now, result)
+        else:
+            cls._supabase_checks.pop(url, None)
+        return result
+    
+    @staticmethod
+    def _probe_supabase(url: str, headers: Optional[dict] = None, session: Optional[requests.Session] = None) -> bool:
+        """Probe the Supabase REST endpoint"""
+        http = session or requests
         try:
-            import socket
-            # DNS resolution check
-            hostname = url.replace('https://', '').replace('http://', '')
-            socket.gethostbyname(hostname.split('/')[0])
-            
-            # HTTP connection check
-            response = requests.get(f"{url}/rest/v1/", headers=headers, timeout=10)
-            return response.status_code == 200
+            # DNS failures surface as connection errors, so no separate lookup is needed
+            with http.get(f"{url}/rest/v1/", headers=headers, timeout=(2, 5), stream=False) as response:
+                return response.status_code == 200
         except Exception:
             return False
 
@@ -207,10 +341,22 @@ class AuthManager:
         }
         self.current_user = None
         self.access_token = None
+        
+        # Shared connection pool so repeated calls reuse kept-alive TLS sockets
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            # Retry failed connects only; a read timeout is not retried so slow replies fail fast
+            max_retries=Retry(total=2, read=0, backoff_factor=0.2)
+        )
+        self.session.mount('https://', adapter)
+        atexit.register(self.close)
     
     def test_connection(self) -> bool:
         """Test Supabase connection"""
-        return NetworkChecker.check_supabase_connection(self.base_url, self.headers)
+        return NetworkChecker.check_supabase_connection(self.base_url, session=self.session)
     
     def sign_in(self, email: str, password: str) -> Dict[str, Any]:
         """Sign in user using custom User table"""
@@ -219,40 +365,48 @@ class AuthManager:
             return {"success": False, "error": "No internet connection available"}
         
         try:
-            # Method 1: Try Supabase Auth first (if you're using auth.users)
-            auth_result = self._try_supabase_auth(email, password)
-            if auth_result["success"]:
-                return auth_result
-            
-            # Method 2: Try custom User table lookup
+            # Method 1: Try custom User table lookup (one request decides most logins)
             table_result = self._try_user_table_auth(email, password)
             if table_result["success"]:
                 return table_result
             
-            # Both methods failed
+            # Method 2: Fall back to Supabase Auth (auth.users) unless the table
+            # already rejected the password for an existing user
+            if table_result.get("error") != "Invalid password":
+                auth_result = self._try_supabase_auth(email, password)
+                if auth_result["success"]:
+                    return auth_result
+            
+            # Both methods failed; a query/connection failure may mean the cached
+            # connectivity result is stale, a rejected credential does not
+            if table_result.get("error") not in ("Invalid password", "User not found", "No table password"):
+                NetworkChecker.invalidate()
             return {"success": False, "error": "Invalid email or password"}
                 
         except Exception as e:
+            NetworkChecker.invalidate()
             logger.error(f"Sign in error: {e}")
             return {"success": False, "error": f"Connection error: {str(e)}"}
     
     def _try_supabase_auth(self, email: str, password: str) -> Dict[str, Any]:
         """Try standard Supabase auth"""
         try:
-            url = f"{self.base_url}/auth/v1/token?grant_type=password"
+            url = f"{self.base_url}/auth/v1/token"
             data = {"email": email, "password": password}
             
-            response = requests.post(url, headers=self.headers, json=data, timeout=10)
-            result = response.json()
-            
-            if response.status_code == 200:
-                self.access_token = result.get("access_token")
-                self.current_user = result.get("user")
-                logger.info(f"User signed in via Supabase Auth: {email}")
-                return {"success": True, "data": result, "method": "supabase_auth"}
-            else:
-                logger.info(f"Supabase Auth failed for {email}, trying User table")
-                return {"success": False, "error": result.get("error_description", "Auth failed")}
+            with self.session.post(url, params={"grant_type": "password"}, json=data, timeout=10, stream=False) as response:
+                if response.status_code == 200:
+                    result = response.json()
+                    self.access_token = result.get("access_token")
+                    self.current_user = result.get("user")
+                    logger.info(f"User signed in via Supabase Auth: {email}")
+                    return {"success": True, "data": result, "method": "supabase_auth"}
+                
+                # Error bodies are only inspected when debugging
+                logger.info(f"Supabase Auth failed for {email}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Supabase Auth response: {response.text[:200]}")
+                return {"success": False, "error": response.reason or "Auth failed"}
                 
         except Exception as e:
             logger.info(f"Supabase Auth error for {email}: {e}")
@@ -265,8 +419,9 @@ class AuthManager:
             url = f"{self.base_url}/rest/v1/{table_name}"
             
             # Query for user by email
-            params = {"email": f"eq.{email}", "select": "*"}
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            params = {"email": f"eq.{email}", "select": "id,email,password,created_at", "limit": "1"}
+            # Auth headers come from the session; a GET carries no JSON body
+            response = self.session.get(url, params=params, headers={"Content-Type": None}, timeout=10, stream=False)
             
             logger.info(f"Searching for email: '{email}'")
             logger.info(f"Response status: {response.status_code}")
@@ -283,6 +438,10 @@ class AuthManager:
                 # Check password
                 stored_password = user.get("password")
                 
+                # Rows mirroring auth.users carry no password; let Supabase Auth decide
+                if not stored_password:
+                    return {"success": False, "error": "No table password"}
+                
                 if self._verify_password(password, stored_password):
                     user_data = {
                         "id": str(user.get("id")),
@@ -322,24 +481,42 @@ class AuthManager:
         # Simple plain text comparison
         return provided_password == stored_password
     
+    def restore_session(self, session_data: Dict[str, Any]) -> bool:
+        """Restore a saved session without a network round-trip"""
+        user = session_data.get("user")
+        if not user:
+            return False
+        
+        self.current_user = user
+        if user.get("table_auth"):
+            self.access_token = f"table_auth_{user.get('id')}"
+        logger.info(f"Session restored for: {user.get('email')}")
+        return True
+    
     def sign_out(self):
         """Sign out user"""
         self.current_user = None
         self.access_token = None
         logger.info("User signed out")
+    
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
 
-class FullscreenSplashScreen(ctk.CTk):
+class FullscreenSplashScreen(ctk.CTkToplevel):
     """Simple, working fullscreen splash screen"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, master, on_close: Optional[Callable] = None):
+        super().__init__(master)
+        
+        self.on_close = on_close
+        self._closed = False
         
         # Configure window
         self.title("Obliterator")
         self.configure(fg_color=COLORS["primary_bg"])
         
-        # Simple fullscreen - get screen dimensions first
-        self.update_idletasks()
+        # Simple fullscreen - screen dimensions need no idle-task flush
         width = self.winfo_screenwidth()
         height = self.winfo_screenheight()
         
@@ -350,10 +527,11 @@ class FullscreenSplashScreen(ctk.CTk):
         self.setup_ui()
         
         # Auto-close after 4 seconds
-        self.after(4000, self.close_splash)
+        self._auto_close_id = self.after(4000, self.close_splash)
         
         # ESC to close early
         self.bind('<Escape>', lambda e: self.close_splash())
+        self.protocol("WM_DELETE_WINDOW", self.close_splash)
         self.focus_set()
     
     def setup_ui(self):
@@ -377,7 +555,7 @@ class FullscreenSplashScreen(ctk.CTk):
         message_label = ctk.CTkLabel(
             center_frame,
             text="Wipe Beyond Recovery...",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=_font(32, "bold"),
             text_color="#ffffff"
         )
         message_label.pack(pady=(40, 60))
@@ -386,7 +564,7 @@ class FullscreenSplashScreen(ctk.CTk):
         loading_label = ctk.CTkLabel(
             center_frame,
             text="Initializing secure authentication...",
-            font=ctk.CTkFont(size=16),
+            font=_font(16),
             text_color=COLORS["text_primary"]
         )
         loading_label.pack(pady=(0, 30))
@@ -406,7 +584,7 @@ class FullscreenSplashScreen(ctk.CTk):
         version_label = ctk.CTkLabel(
             main_frame,
             text="v1.0.0 | Obliterator Authentication System\nPress ESC to continue",
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             text_color=COLORS["text_secondary"]
         )
         version_label.pack(side="bottom", pady=40)
@@ -414,23 +592,9 @@ class FullscreenSplashScreen(ctk.CTk):
     def load_logo(self, parent):
         """Load logo image"""
         try:
-            from PIL import Image
-            
-            if os.path.exists("Logo.png"):
-                # Load and resize image
-                pil_image = Image.open("Logo.png")
-                original_width, original_height = pil_image.size
-                
-                # Resize to max 400px
-                max_size = 400
-                if original_width > original_height:
-                    new_width = min(max_size, original_width)
-                    new_height = int((new_width / original_width) * original_height)
-                else:
-                    new_height = min(max_size, original_height)
-                    new_width = int((new_height / original_height) * original_width)
-                
-                resized_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            if Image is not None and os.path.exists("Logo.png"):
+                # Load image resized to max 400px
+                resized_image, new_width, new_height = _get_scaled_logo("Logo.png", 400)
                 
                 # Create CTk image
                 logo_image = ctk.CTkImage(
@@ -456,20 +620,28 @@ class FullscreenSplashScreen(ctk.CTk):
         title_label = ctk.CTkLabel(
             parent,
             text="Obliterator",
-            font=ctk.CTkFont(size=72, weight="bold"),
+            font=_font(72, "bold"),
             text_color=COLORS["accent"]
         )
         title_label.pack(pady=(100, 0))
     
     def close_splash(self):
-        """Close splash"""
+        """Close splash and hand over to the next window"""
+        if self._closed:
+            return
+        self._closed = True
+        
+        self.after_cancel(self._auto_close_id)
         self.destroy()
+        
+        if self.on_close:
+            self.on_close()
 
-class FullscreenLoginWindow(ctk.CTk):
+class FullscreenLoginWindow(ctk.CTkToplevel):
     """Simple fullscreen login window"""
     
-    def __init__(self, auth_manager: AuthManager, session_manager: SessionManager):
-        super().__init__()
+    def __init__(self, master, auth_manager: AuthManager, session_manager: SessionManager):
+        super().__init__(master)
         
         self.auth_manager = auth_manager
         self.session_manager = session_manager
@@ -480,7 +652,6 @@ class FullscreenLoginWindow(ctk.CTk):
         self.configure(fg_color=COLORS["primary_bg"])
         
         # Simple fullscreen
-        self.update_idletasks()
         width = self.winfo_screenwidth()
         height = self.winfo_screenheight()
         self.geometry(f"{width}x{height}+0+0")
@@ -489,8 +660,9 @@ class FullscreenLoginWindow(ctk.CTk):
         self.setup_ui()
         self.check_existing_session()
         
-        # ESC to exit (development)
+        # ESC or closing the window ends the login loop
         self.bind('<Escape>', lambda e: self.quit())
+        self.protocol("WM_DELETE_WINDOW", self.quit)
         self.focus_set()
     
     def setup_ui(self):
@@ -534,7 +706,7 @@ class FullscreenLoginWindow(ctk.CTk):
         subtitle_label = ctk.CTkLabel(
             header_frame,
             text="Secure Authentication Required",
-            font=ctk.CTkFont(size=16),
+            font=_font(16),
             text_color=COLORS["text_secondary"]
         )
         subtitle_label.pack()
@@ -542,26 +714,9 @@ class FullscreenLoginWindow(ctk.CTk):
     def load_header_logo(self, parent):
         """Load logo for login header - using Logo2.png (pre-resized)"""
         try:
-            from PIL import Image
-            
-            if os.path.exists("Logo2.png"):
+            if Image is not None and os.path.exists("Logo2.png"):
                 # Load Logo2.png
-                pil_image = Image.open("Logo2.png")
-                original_width, original_height = pil_image.size
-                
-                max_size = 250
-                if original_width > max_size or original_height > max_size:
-                    if original_width > original_height:
-                        new_width = min(max_size, original_width)
-                        new_height = int((new_width / original_width) * original_height)
-                    else:
-                        new_height = min(max_size, original_height)
-                        new_width = int((new_height / original_height) * original_width)
-                    
-                    resized_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                else:
-                    resized_image = pil_image
-                    new_width, new_height = original_width, original_height
+                resized_image, new_width, new_height = _get_scaled_logo("Logo2.png", 250)
                 
                 # Create CTk image
                 logo_image = ctk.CTkImage(
@@ -576,20 +731,9 @@ class FullscreenLoginWindow(ctk.CTk):
                 
                 print(f"Logo2.png loaded: {new_width}x{new_height}")
                 
-            elif os.path.exists("Logo.png"):
+            elif Image is not None and os.path.exists("Logo.png"):
                 # Fallback to original Logo.png if Logo2.png not found
-                pil_image = Image.open("Logo.png")
-                original_width, original_height = pil_image.size
-                
-                max_size = 150
-                if original_width > original_height:
-                    new_width = min(max_size, original_width)
-                    new_height = int((new_width / original_width) * original_height)
-                else:
-                    new_height = min(max_size, original_height)
-                    new_width = int((new_height / original_height) * original_width)
-                
-                resized_image = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                resized_image, new_width, new_height = _get_scaled_logo("Logo.png", 150)
                 
                 logo_image = ctk.CTkImage(
                     light_image=resized_image,
@@ -607,7 +751,7 @@ class FullscreenLoginWindow(ctk.CTk):
                 title_label = ctk.CTkLabel(
                     parent,
                     text="Obliterator",
-                    font=ctk.CTkFont(size=32, weight="bold"),
+                    font=_font(32, "bold"),
                     text_color=COLORS["accent"]
                 )
                 title_label.pack(pady=(0, 10))
@@ -618,7 +762,7 @@ class FullscreenLoginWindow(ctk.CTk):
             title_label = ctk.CTkLabel(
                 parent,
                 text="Obliterator",
-                font=ctk.CTkFont(size=32, weight="bold"),
+                font=_font(32, "bold"),
                 text_color=COLORS["accent"]
             )
             title_label.pack(pady=(0, 10))
@@ -633,7 +777,7 @@ class FullscreenLoginWindow(ctk.CTk):
         email_label = ctk.CTkLabel(
             form_frame,
             text="Email Address",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=COLORS["text_primary"],
             anchor="w"
         )
@@ -643,7 +787,7 @@ class FullscreenLoginWindow(ctk.CTk):
             form_frame,
             placeholder_text="Enter your email address",
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             fg_color=COLORS["input_bg"],
             border_color=COLORS["border"],
             text_color=COLORS["text_primary"]
@@ -654,7 +798,7 @@ class FullscreenLoginWindow(ctk.CTk):
         password_label = ctk.CTkLabel(
             form_frame,
             text="Password",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color=COLORS["text_primary"],
             anchor="w"
         )
@@ -665,7 +809,7 @@ class FullscreenLoginWindow(ctk.CTk):
             placeholder_text="Enter your password",
             show="*",
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
             fg_color=COLORS["input_bg"],
             border_color=COLORS["border"],
             text_color=COLORS["text_primary"]
@@ -678,7 +822,7 @@ class FullscreenLoginWindow(ctk.CTk):
             form_frame,
             text="Remember me for 24 hours",
             variable=self.remember_var,
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=COLORS["text_secondary"],
             fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"]
@@ -689,7 +833,7 @@ class FullscreenLoginWindow(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             form_frame,
             text="",
-            font=ctk.CTkFont(size=13),
+            font=_font(13),
             text_color=COLORS["error"]
         )
         self.status_label.pack(fill="x", pady=(0, 10))
@@ -704,7 +848,7 @@ class FullscreenLoginWindow(ctk.CTk):
             button_frame,
             text="Sign In",
             height=50,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=_font(16, "bold"),
             fg_color=COLORS["accent"],
             hover_color=COLORS["accent_hover"],
             text_color=COLORS["text_primary"],
@@ -716,7 +860,7 @@ class FullscreenLoginWindow(ctk.CTk):
         self.connection_info = ctk.CTkLabel(
             button_frame,
             text="Checking network...",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color=COLORS["text_secondary"]
         )
         self.connection_info.pack()
@@ -737,7 +881,7 @@ class FullscreenLoginWindow(ctk.CTk):
         security_label = ctk.CTkLabel(
             footer_frame,
             text="Secured with industry-standard encryption",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color=COLORS["text_secondary"]
         )
         security_label.pack()
@@ -767,12 +911,20 @@ class FullscreenLoginWindow(ctk.CTk):
         threading.Thread(target=check, daemon=True).start()
     
     def check_existing_session(self):
-        """Check for existing session"""
+        """Check for existing session without blocking the first paint"""
+        threading.Thread(target=self._async_check_existing_session, daemon=True).start()
+    
+    def _async_check_existing_session(self):
+        """Load the saved session off the UI thread"""
         session_data = self.session_manager.load_session()
         if session_data and self.session_manager.is_valid_session():
             if session_data.get("remember_me", False):
-                self.auth_manager.current_user = session_data["user"]
-                self.on_login_success(session_data["user"])
+                self.after(0, lambda d=session_data: self._apply_session(d))
+    
+    def _apply_session(self, session_data: Dict[str, Any]):
+        """Restore a remembered session on the UI thread"""
+        if self.auth_manager.restore_session(session_data):
+            self.on_login_success(session_data["user"])
     
     def handle_login(self):
         """Handle login - simplified"""
@@ -783,15 +935,11 @@ class FullscreenLoginWindow(ctk.CTk):
             self.show_status("Please enter both email and password", error=True)
             return
         
-        if "@" not in email:
+        if not _EMAIL_RE.match(email):
             self.show_status("Please enter a valid email address", error=True)
             return
         
-        # Check internet
-        if not NetworkChecker.check_internet_connection():
-            self.show_status("No internet connection. Check your network.", error=True)
-            return
-        
+        # Connectivity is checked by sign_in on the worker thread, never here on the Tk thread
         self.login_button.configure(text="Signing In...", state="disabled")
         self.show_status("Authenticating...", error=False)
         
@@ -863,17 +1011,25 @@ class LoginSystem:
         try:
             print("Starting authentication...")
             
-            # Show splash screen
-            splash = FullscreenSplashScreen()
-            splash.mainloop()
+            # Remembered, unexpired session: skip the UI entirely
+            saved = self.session_manager.session_data
+            if (self.session_manager.is_valid_session() and saved.get("remember_me", False)
+                    and self.auth_manager.restore_session(saved)):
+                self.user_data = saved["user"]
+                self.authenticated = True
+                return True
             
-            # Small delay for cleanup
-            time.sleep(0.2)
+            # One hidden root hosts the splash and then the login window
+            root = ctk.CTk()
+            root.withdraw()
             
-            # Show login window
-            self.login_window = FullscreenLoginWindow(self.auth_manager, self.session_manager)
-            self.login_window.set_login_success_callback(self._on_login_success)
-            self.login_window.mainloop()
+            # Show splash screen; the login window opens when it closes
+            FullscreenSplashScreen(root, on_close=lambda: self._show_login_window(root))
+            root.mainloop()
+            
+            root.destroy()
+            # Cached fonts belong to the root just destroyed
+            _font.cache_clear()
             
             return self.authenticated
             
@@ -882,6 +1038,16 @@ class LoginSystem:
             messagebox.showerror("Authentication Error", f"Error: {e}")
             return False
     
+    def _show_login_window(self, root):
+        """Show login window on the shared root"""
+        try:
+            self.login_window = FullscreenLoginWindow(root, self.auth_manager, self.session_manager)
+            self.login_window.set_login_success_callback(self._on_login_success)
+        except Exception as e:
+            # Nothing visible would be left on the hidden root, so end the loop
+            logger.error(f"Failed to open login window: {e}")
+            root.quit()
+    
     def _on_login_success(self, user_data: Dict[str, Any]):
         """Handle successful login - MODIFIED: Set data and close immediately"""
         self.user_data = user_data
@@ -912,6 +1078,8 @@ class LoginSystem:
         self.session_manager.clear_session()
         self.user_data = None
         self.authenticated = False
+        # The window belonged to the finished login; authenticate_user() builds a fresh one
+        self.login_window = None
         logger.info("User logged out")
     
     def get_access_token(self) -> Optional[str]:
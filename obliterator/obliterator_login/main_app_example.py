@@ -9,38 +9,174 @@ from login_system import LoginSystem
 import tkinter.messagebox as messagebox
 import sys
 import os
+import queue
+import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Main window color palette
+COLORS = {
+    "window_bg": "#1a1a2e",         # Window background
+    "panel_bg": "#16213e",          # Header and content panels
+    "section_bg": "#0f1419",        # Wiping sections
+    "dropdown_bg": "#2d2d44",       # Option menu dropdown
+    "accent": "#bb86fc",            # Purple accent
+    "accent_button": "#9c6dfd",     # Option menu button
+    "text_primary": "#ffffff",      # Section titles
+    "text_secondary": "#8692f7",    # Secondary text
+    "danger": "#dc3545",            # Logout / wipe
+    "danger_hover": "#c82333",      # Logout / wipe hover
+    "success": "#28a745",           # Scan
+    "success_hover": "#218838",     # Scan hover
+    "verify": "#6f42c1",            # Verify
+    "verify_hover": "#5a359c"       # Verify hover
+}
+
+# Action row: (label, COLORS key, handler method)
+ACTION_BUTTONS = (
+    ("Scan for Drives", "success", "scan_drives"),
+    ("Start Wipe", "danger", "start_wipe"),
+    ("Verify Wipe", "verify", "verify_wipe"),
+)
+
+class MessageDialog(ctk.CTkToplevel):
+    """Modal message/confirmation dialog, built once and reconfigured for each prompt"""
+    
+    def __init__(self, master, body_font, button_font):
+        super().__init__(master)
+        self.configure(fg_color=COLORS["panel_bg"])
+        self.resizable(False, False)
+        self.transient(master)
+        self.withdraw()
+        self._on_result = None
+        
+        self.message_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=body_font,
+            text_color=COLORS["text_primary"],
+            wraplength=380,
+            justify="left"
+        )
+        self.message_label.pack(padx=25, pady=(20, 15))
+        
+        button_row = ctk.CTkFrame(self, fg_color="transparent")
+        button_row.pack(pady=(0, 20))
+        
+        self.confirm_btn = ctk.CTkButton(
+            button_row,
+            text="OK",
+            width=100,
+            height=32,
+            font=button_font,
+            fg_color=COLORS["accent"],
+            hover_color=COLORS["accent_button"],
+            command=lambda: self._finish(True)
+        )
+        self.confirm_btn.pack(side="left", padx=5)
+        
+        self.cancel_btn = ctk.CTkButton(
+            button_row,
+            text="Cancel",
+            width=100,
+            height=32,
+            font=button_font,
+            fg_color=COLORS["dropdown_bg"],
+            hover_color=COLORS["section_bg"],
+            command=lambda: self._finish(False)
+        )
+        
+        self.protocol("WM_DELETE_WINDOW", lambda: self._finish(False))
+    
+    def show(self, title, message, on_result=None, confirm_text="OK", cancel_text=None):
+        """Reconfigure and show the dialog; on_result receives True or False"""
+        self._on_result = on_result
+        self.title(title)
+        self.message_label.configure(text=message)
+        self.confirm_btn.configure(text=confirm_text)
+        if cancel_text:
+            self.cancel_btn.configure(text=cancel_text)
+            self.cancel_btn.pack(side="left", padx=5)
+        else:
+            self.cancel_btn.pack_forget()
+        
+        self.deiconify()
+        self.lift()
+        # A grab needs the window mapped first
+        self.after(10, self._grab)
+    
+    def _grab(self):
+        """Grab input if the dialog is still showing"""
+        if self.winfo_viewable():
+            self.grab_set()
+    
+    def _finish(self, result):
+        """Hide the dialog and report the answer"""
+        self.grab_release()
+        self.withdraw()
+        on_result, self._on_result = self._on_result, None
+        if on_result:
+            on_result(result)
 
 class SecureWipeMainApp(ctk.CTk):
     """Main application that uses the login system"""
     
-    def __init__(self):
+    def __init__(self, login_system=None):
         super().__init__()
         
-        # Initialize login system
-        self.login_system = LoginSystem()
+        # Initialize login system (main() may hand over one that is already authenticated)
+        self.login_system = login_system or LoginSystem()
         self.user_data = None
         
         # Configure main window
         self.title("SecureWipe Pro - Data Wiping Tool")
         self.geometry("800x600")
-        self.configure(fg_color="#1a1a2e")
+        self.configure(fg_color=COLORS["window_bg"])
+        
+        # Fonts are built once for the life of the root and shared by every widget
+        self._font_app_title = ctk.CTkFont(size=22, weight="bold")
+        self._font_welcome = ctk.CTkFont(size=24, weight="bold")
+        self._font_section = ctk.CTkFont(size=16, weight="bold")
+        self._font_subtitle = ctk.CTkFont(size=14)
+        self._font_button = ctk.CTkFont(size=12, weight="bold")
+        self._font_body = ctk.CTkFont(size=12)
+        self._font_small = ctk.CTkFont(size=11)
+        
+        # One dialog serves every prompt; it stays withdrawn between uses
+        self._dialog = MessageDialog(self, self._font_body, self._font_button)
+        
+        # All session widgets live in this frame so logout can drop them in one go
+        self._main_container = None
+        self._session_result = "exit"
+        self._screen = None
+        # Blocking device work runs here, never on the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self.protocol("WM_DELETE_WINDOW", self.handle_close)
         
         # Hide window until authentication
         self.withdraw()
+    
+    def run_session(self):
+        """Authenticate and run the main interface until logout or close; returns "logout" or "exit" """
+        self._session_result = "exit"
+        if not self.authenticate_and_start():
+            return "exit"
         
-        # Authenticate user first
-        self.authenticate_and_start()
+        self.mainloop()
+        return self._session_result
     
     def authenticate_and_start(self):
-        """Handle authentication and start main app"""
+        """Handle authentication and start main app; returns True once the interface is shown"""
         try:
-            print("🔐 Starting authentication...")
+            logger.info("Starting authentication...")
             
-            # Run login system
-            if self.login_system.authenticate_user():
+            # Run login system unless the user is already signed in
+            if self.login_system.is_authenticated() or self.login_system.authenticate_user():
                 # Authentication successful
                 self.user_data = self.login_system.get_user_session()
-                print(f"✅ User authenticated: {self.user_data.get('email')}")
+                logger.info(f"User authenticated: {self.user_data.get('email')}")
                 
                 # Show main window
                 self.deiconify()
@@ -48,30 +184,39 @@ class SecureWipeMainApp(ctk.CTk):
                 
                 # Setup main interface
                 self.setup_main_interface()
+                return True
                 
             else:
                 # Authentication failed
-                print("❌ Authentication failed or cancelled")
-                self.destroy()
+                logger.warning("Authentication failed or cancelled")
+                return False
                 
         except Exception as e:
-            print(f"💥 Authentication error: {e}")
+            logger.error(f"Authentication error: {e}")
             messagebox.showerror("Authentication Error", f"Failed to authenticate:\n{e}")
-            self.destroy()
+            return False
     
     def center_window(self):
         """Center main window"""
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() // 2) - (800 // 2)
-        y = (self.winfo_screenheight() // 2) - (600 // 2)
+        # Screen size is fixed for the root's lifetime; no layout pass is needed to read it
+        if self._screen is None:
+            self._screen = (self.winfo_screenwidth(), self.winfo_screenheight())
+        screen_width, screen_height = self._screen
+        x = (screen_width // 2) - (800 // 2)
+        y = (screen_height // 2) - (600 // 2)
         self.geometry(f"800x600+{x}+{y}")
     
     def setup_main_interface(self):
         """Setup the main application interface"""
+        self._main_container = ctk.CTkFrame(self, fg_color="transparent")
+        self._main_container.pack(fill="both", expand=True)
+        # Header row sizes to its contents, content row takes the rest
+        self._main_container.grid_columnconfigure(0, weight=1)
+        self._main_container.grid_rowconfigure(1, weight=1)
+        
         # Header frame
-        header_frame = ctk.CTkFrame(self, fg_color="#16213e", height=80)
-        header_frame.pack(fill="x", padx=20, pady=(20, 10))
-        header_frame.pack_propagate(False)
+        header_frame = ctk.CTkFrame(self._main_container, fg_color=COLORS["panel_bg"])
+        header_frame.grid(row=0, column=0, sticky="ew", padx=20, pady=(20, 10))
         
         # Left side - app info
         info_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
@@ -80,16 +225,16 @@ class SecureWipeMainApp(ctk.CTk):
         app_title = ctk.CTkLabel(
             info_frame,
             text="SecureWipe Pro",
-            font=ctk.CTkFont(size=22, weight="bold"),
-            text_color="#bb86fc"
+            font=self._font_app_title,
+            text_color=COLORS["accent"]
         )
         app_title.pack(anchor="w")
         
         user_info = ctk.CTkLabel(
             info_frame,
             text=f"Authenticated as: {self.user_data.get('email')}",
-            font=ctk.CTkFont(size=11),
-            text_color="#8692f7"
+            font=self._font_small,
+            text_color=COLORS["text_secondary"]
         )
         user_info.pack(anchor="w")
         
@@ -102,16 +247,16 @@ class SecureWipeMainApp(ctk.CTk):
             text="Logout",
             width=80,
             height=30,
-            font=ctk.CTkFont(size=11),
-            fg_color="#dc3545",
-            hover_color="#c82333",
+            font=self._font_small,
+            fg_color=COLORS["danger"],
+            hover_color=COLORS["danger_hover"],
             command=self.handle_logout
         )
         logout_btn.pack()
         
         # Main content area
-        content_frame = ctk.CTkFrame(self, fg_color="#16213e")
-        content_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        content_frame = ctk.CTkFrame(self._main_container, fg_color=COLORS["panel_bg"])
+        content_frame.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 20))
         
         # Welcome message
         welcome_frame = ctk.CTkFrame(content_frame, fg_color="transparent")
@@ -120,16 +265,16 @@ class SecureWipeMainApp(ctk.CTk):
         welcome_title = ctk.CTkLabel(
             welcome_frame,
             text="Welcome to SecureWipe Pro!",
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color="#bb86fc"
+            font=self._font_welcome,
+            text_color=COLORS["accent"]
         )
         welcome_title.pack(pady=(0, 10))
         
         welcome_text = ctk.CTkLabel(
             welcome_frame,
             text="Professional Data Wiping Solution\nSecure • Reliable • Compliant",
-            font=ctk.CTkFont(size=14),
-            text_color="#8692f7"
+            font=self._font_subtitle,
+            text_color=COLORS["text_secondary"]
         )
         welcome_text.pack(pady=(0, 30))
         
@@ -139,177 +284,222 @@ class SecureWipeMainApp(ctk.CTk):
     def setup_wiping_interface(self, parent):
         """Setup mock data wiping interface"""
         # Drive selection section
-        drive_frame = ctk.CTkFrame(parent, fg_color="#0f1419")
-        drive_frame.pack(fill="x", pady=(0, 20))
+        drive_frame = self._build_section(parent, "🗂️ Drive Selection")
         
-        drive_title = ctk.CTkLabel(
-            drive_frame,
-            text="🗂️ Drive Selection",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#ffffff"
-        )
-        drive_title.pack(pady=(15, 10), padx=20, anchor="w")
-        
-        drive_info = ctk.CTkLabel(
+        self.drive_info = ctk.CTkLabel(
             drive_frame,
             text="No drives detected. Connect a drive to begin wiping process.",
-            font=ctk.CTkFont(size=12),
-            text_color="#8692f7"
+            font=self._font_body,
+            text_color=COLORS["text_secondary"]
         )
-        drive_info.pack(pady=(0, 15), padx=20, anchor="w")
+        self.drive_info.pack(pady=(0, 15), padx=20, anchor="w")
         
         # Wipe method selection
-        method_frame = ctk.CTkFrame(parent, fg_color="#0f1419")
-        method_frame.pack(fill="x", pady=(0, 20))
-        
-        method_title = ctk.CTkLabel(
-            method_frame,
-            text="🔧 Wipe Method",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#ffffff"
-        )
-        method_title.pack(pady=(15, 10), padx=20, anchor="w")
+        method_frame = self._build_section(parent, "🔧 Wipe Method")
         
         self.wipe_method_var = ctk.StringVar(value="Quick Wipe")
         method_menu = ctk.CTkOptionMenu(
             method_frame,
             values=["Quick Wipe (1 Pass)", "Secure Wipe (3 Pass)", "Military Grade (7 Pass)"],
             variable=self.wipe_method_var,
-            font=ctk.CTkFont(size=12),
-            fg_color="#bb86fc",
-            button_color="#9c6dfd",
-            dropdown_fg_color="#2d2d44"
+            font=self._font_body,
+            fg_color=COLORS["accent"],
+            button_color=COLORS["accent_button"],
+            dropdown_fg_color=COLORS["dropdown_bg"]
         )
         method_menu.pack(pady=(0, 15), padx=20, anchor="w")
         
         # Action buttons
-        action_frame = ctk.CTkFrame(parent, fg_color="#0f1419")
-        action_frame.pack(fill="x")
-        
-        action_title = ctk.CTkLabel(
-            action_frame,
-            text="🚀 Actions",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color="#ffffff"
-        )
-        action_title.pack(pady=(15, 10), padx=20, anchor="w")
+        action_frame = self._build_section(parent, "🚀 Actions")
         
         button_container = ctk.CTkFrame(action_frame, fg_color="transparent")
         button_container.pack(pady=(0, 15), padx=20, anchor="w")
         
-        scan_btn = ctk.CTkButton(
-            button_container,
-            text="Scan for Drives",
-            width=120,
-            height=35,
-            font=ctk.CTkFont(size=12, weight="bold"),
-            fg_color="#28a745",
-            hover_color="#218838",
-            command=self.scan_drives
-        )
-        scan_btn.pack(side="left", padx=(0, 10))
-        
-        wipe_btn = ctk.CTkButton(
-            button_container,
-            text="Start Wipe",
-            width=120,
-            height=35,
-            font=ctk.CTkFont(size=12, weight="bold"),
-            fg_color="#dc3545",
-            hover_color="#c82333",
-            command=self.start_wipe
-        )
-        wipe_btn.pack(side="left", padx=10)
-        
-        verify_btn = ctk.CTkButton(
-            button_container,
-            text="Verify Wipe",
-            width=120,
-            height=35,
-            font=ctk.CTkFont(size=12, weight="bold"),
-            fg_color="#6f42c1",
-            hover_color="#5a359c",
-            command=self.verify_wipe
+        action_buttons = {}
+        for index, (text, color, handler) in enumerate(ACTION_BUTTONS):
+            button = ctk.CTkButton(
+                button_container,
+                text=text,
+                width=120,
+                height=35,
+                font=self._font_button,
+                fg_color=COLORS[color],
+                hover_color=COLORS[f"{color}_hover"],
+                command=getattr(self, handler)
+            )
+            button.pack(side="left", padx=(0 if index == 0 else 20, 0))
+            action_buttons[handler] = button
+        self.scan_btn = action_buttons["scan_drives"]
+        
+        # Sections are attached only once their contents exist
+        drive_frame.pack(fill="x", pady=(0, 20))
+        method_frame.pack(fill="x", pady=(0, 20))
+        action_frame.pack(fill="x")
+    
+    def _build_section(self, parent, title):
+        """Create an unpacked, titled section panel"""
+        frame = ctk.CTkFrame(parent, fg_color=COLORS["section_bg"])
+        
+        title_label = ctk.CTkLabel(
+            frame,
+            text=title,
+            font=self._font_section,
+            text_color=COLORS["text_primary"]
         )
-        verify_btn.pack(side="left", padx=(10, 0))
+        title_label.pack(pady=(15, 10), padx=20, anchor="w")
+        return frame
+    
+    def show_dialog(self, title, message, on_result=None, confirm_text="OK", cancel_text=None):
+        """Show a modal dialog without a nested event loop; on_result receives True or False"""
+        self._dialog.show(title, message, on_result, confirm_text, cancel_text)
+    
+    def ask_confirmation(self, title, message, on_result):
+        """Ask a yes/no question; on_result receives the answer"""
+        self.show_dialog(title, message, on_result, confirm_text="Yes", cancel_text="No")
     
     def scan_drives(self):
-        """Mock drive scanning function"""
-        messagebox.showinfo(
-            "Drive Scan", 
-            "Drive scanning functionality would be implemented here.\n\nThis would detect and list all connected storage devices for wiping."
-        )
+        """Scan for drives on a worker thread and render the result when done"""
+        self.scan_btn.configure(state="disabled", text="Scanning...")
+        self.drive_info.configure(text="Scanning for connected drives...")
+        
+        future = self._executor.submit(self._do_scan_drives)
+        future.add_done_callback(lambda f: self.after(0, self._render_drives, f))
+    
+    def _do_scan_drives(self):
+        """Mock drive enumeration; the real device scan would go here"""
+        return []
+    
+    def _render_drives(self, future):
+        """Show scan results in the drive section"""
+        # The session may have ended while the scan was running
+        if self._main_container is None:
+            return
+        
+        self.scan_btn.configure(state="normal", text="Scan for Drives")
+        try:
+            drives = future.result()
+        except Exception as e:
+            self.drive_info.configure(text=f"Drive scan failed: {e}")
+            return
+        
+        if drives:
+            self.drive_info.configure(text=f"Detected drives: {', '.join(drives)}")
+        else:
+            self.drive_info.configure(text="No drives detected. Connect a drive to begin wiping process.")
     
     def start_wipe(self):
         """Mock wipe start function"""
         method = self.wipe_method_var.get()
-        result = messagebox.askyesno(
+        self.ask_confirmation(
             "Confirm Wipe",
             f"Are you sure you want to start {method}?\n\nThis action cannot be undone and will permanently destroy all data.",
-            icon="warning"
+            lambda confirmed: self._on_wipe_confirmed(method, confirmed)
         )
-        
-        if result:
-            messagebox.showinfo(
+    
+    def _on_wipe_confirmed(self, method, confirmed):
+        """Start the wipe once the user has confirmed"""
+        if confirmed:
+            self.show_dialog(
                 "Wipe Started",
                 f"Data wiping process started with {method}.\n\nThis is where the actual wiping logic would be implemented."
             )
     
     def verify_wipe(self):
         """Mock wipe verification function"""
-        messagebox.showinfo(
+        self.show_dialog(
             "Verify Wipe",
             "Wipe verification functionality would be implemented here.\n\nThis would scan the drive to ensure data has been properly destroyed."
         )
     
     def handle_logout(self):
         """Handle user logout"""
-        result = messagebox.askyesno(
+        self.ask_confirmation(
             "Logout Confirmation",
             "Are you sure you want to logout?\n\nAny active operations will be stopped.",
-            icon="warning"
+            self._on_logout_confirmed
         )
-        
-        if result:
-            print("🔓 User logging out...")
+    
+    def _on_logout_confirmed(self, confirmed):
+        """Log out once the user has confirmed"""
+        if confirmed:
+            logger.info("User logging out...")
             
             # Logout from login system
             self.login_system.logout()
             
-            # Close current window
-            self.destroy()
+            # Drop this session's widgets; main() re-authenticates on the same root
+            self._main_container.destroy()
+            self._main_container = None
+            self.withdraw()
             
-            # Restart authentication
-            print("🔄 Restarting authentication...")
-            new_app = SecureWipeMainApp()
-            new_app.mainloop()
+            self._session_result = "logout"
+            self.quit()
+    
+    def destroy(self):
+        """Stop background work before tearing down the root"""
+        self._executor.shutdown(wait=False)
+        super().destroy()
+    
+    def handle_close(self):
+        """Handle the window being closed"""
+        self._session_result = "exit"
+        self.quit()
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener's handlers"""
+    
+    def prepare(self, record):
+        # The queue never leaves this process, so the record can be passed through untouched
+        return record
+
+def start_log_listener():
+    """Move the root logger's handlers behind a queue so records are written off the UI thread"""
+    root_logger = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [DeferredQueueHandler(log_queue)]
+    listener.start()
+    return listener
 
 def main():
     """Main function"""
-    print("🚀 Starting SecureWipe Pro with Authentication...")
-    print("=" * 50)
+    log_listener = start_log_listener()
+    logger.info("Starting SecureWipe Pro with Authentication...")
     
     try:
         # Check if login system files exist
         required_files = ["login_system.py", "config.json"]
-        missing_files = [f for f in required_files if not os.path.exists(f)]
+        with os.scandir('.') as entries:
+            present = {entry.name for entry in entries}
+        missing_files = [f for f in required_files if f not in present]
         
         if missing_files:
-            print(f"❌ Missing required files: {', '.join(missing_files)}")
-            print("Please ensure all required files are in the same directory.")
+            logger.error(f"Missing required files: {', '.join(missing_files)}. "
+                         "Please ensure all required files are in the same directory.")
+            return
+        
+        # Authenticate before building the main window so a cancelled login never creates it
+        login_system = LoginSystem()
+        if not login_system.authenticate_user():
+            logger.warning("Authentication failed or cancelled")
             return
         
-        # Create and run main application
-        app = SecureWipeMainApp()
-        app.mainloop()
+        # One root for the whole process; each logout loops back to authentication
+        app = SecureWipeMainApp(login_system)
+        while app.run_session() == "logout":
+            logger.info("Restarting authentication...")
+        app.destroy()
         
-        print("👋 Application closed.")
+        logger.info("Application closed.")
         
     except KeyboardInterrupt:
-        print("\n⚠️  Application interrupted by user")
+        logger.warning("Application interrupted by user")
     except Exception as e:
-        print(f"💥 Application error: {e}")
+        logger.error(f"Application error: {e}")
         messagebox.showerror("Application Error", f"An error occurred:\n{e}")
+    finally:
+        # Flush queued records before the interpreter exits
+        log_listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file